@@ -0,0 +1,91 @@
+import time
+import torch
+from game_prompts import build_introduction_prompt, build_action_prompt
+from llm_integration import AssistedLLM
+
+NEW_TOKENS = 100
+SEED = 0
+
+def build_game_prompts():
+    """Build benchmark prompts from the same templates the game sends to the LLM"""
+    return [
+        build_introduction_prompt("Aria", "Mage"),
+        build_action_prompt(
+            "Borin", "Warrior", 100, "village",
+            ["sword", "shield", "light armor"],
+            ["Explore the nearby village"],
+            "Head into the dark forest", is_combat=True
+        ),
+        build_action_prompt(
+            "Nyx", "Rogue", 85, "dark_forest",
+            ["dagger", "lockpicks", "light armor"],
+            ["Investigate rumors of a valuable treasure", "Head into the dark forest"],
+            "Search the hollow tree", is_combat=False
+        ),
+    ]
+
+def run_target_only(llm, prompt, do_sample):
+    """Decode one prompt with the target model alone, returning (new tokens, seconds)"""
+    inputs = llm.tokenizer(prompt, return_tensors="pt")
+    torch.manual_seed(SEED)
+    start = time.perf_counter()
+    with torch.no_grad():
+        output = llm.model.generate(
+            **inputs,
+            max_new_tokens=NEW_TOKENS,
+            do_sample=do_sample,
+            pad_token_id=llm.tokenizer.eos_token_id,
+        )
+    elapsed = time.perf_counter() - start
+    return output.shape[1] - inputs["input_ids"].shape[1], elapsed
+
+def run_assisted(llm, prompt, do_sample):
+    """Decode one prompt with draft-model assistance, returning its stats"""
+    prompt_tokens = len(llm.tokenizer(prompt)["input_ids"])
+    torch.manual_seed(SEED)
+    llm.generate_text(prompt, max_length=prompt_tokens + NEW_TOKENS, do_sample=do_sample)
+    return llm.last_stats
+
+def benchmark(llm, prompts, do_sample):
+    """Time target-only and assisted decoding on each prompt, printing per-prompt numbers"""
+    target_tokens = 0
+    target_seconds = 0.0
+    assisted_tokens = 0
+    assisted_seconds = 0.0
+    draft_tokens = 0
+    accepted_tokens = 0
+    for i, prompt in enumerate(prompts, 1):
+        tokens, seconds = run_target_only(llm, prompt, do_sample)
+        stats = run_assisted(llm, prompt, do_sample)
+        print(f"Prompt {i}:")
+        print(f"  Target only: {tokens} tokens in {seconds:.2f}s ({tokens / seconds:.1f} tok/s)")
+        print(f"  Assisted:    {stats['new_tokens']} tokens in {stats['seconds']:.2f}s "
+              f"({stats['tokens_per_second']:.1f} tok/s), "
+              f"acceptance rate {stats['acceptance_rate']:.0%}")
+        target_tokens += tokens
+        target_seconds += seconds
+        assisted_tokens += stats["new_tokens"]
+        assisted_seconds += stats["seconds"]
+        draft_tokens += stats["draft_tokens"]
+        accepted_tokens += stats["accepted_tokens"]
+
+    baseline = target_tokens / target_seconds
+    assisted = assisted_tokens / assisted_seconds
+    acceptance = accepted_tokens / draft_tokens if draft_tokens else 0.0
+    print(f"Target only: {baseline:.1f} tok/s")
+    print(f"Assisted: {assisted:.1f} tok/s, acceptance rate {acceptance:.0%}")
+    print(f"Speedup: {assisted / baseline:.2f}x")
+
+if __name__ == "__main__":
+    # Per-call telemetry is off; benchmark() prints the numbers next to the target-only run
+    llm = AssistedLLM(verbose=False)
+    prompts = build_game_prompts()
+
+    # Pay one-time allocation and warm-up costs in both modes before timing anything
+    print("Warming up...")
+    run_target_only(llm, prompts[0], do_sample=False)
+    run_assisted(llm, prompts[0], do_sample=False)
+
+    for do_sample in (False, True):
+        print(f"\n== {'Sampled' if do_sample else 'Greedy'} decoding ==")
+        benchmark(llm, prompts, do_sample)
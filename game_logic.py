@@ -1,5 +1,6 @@
 import random
 from llm_integration import get_llm
+from game_prompts import CHARACTER_TRAITS, LOCATIONS, describe_character, build_introduction_prompt, build_action_prompt
 
 # Initialize the LLM interface
 llm = get_llm()
@@ -8,37 +9,10 @@ llm = get_llm()
 class AdventureGame:
     def __init__(self):
         self.story_context = ""
-        self.character_traits = {
-            "Warrior": {
-                "strengths": ["combat", "strength", "endurance"],
-                "weaknesses": ["magic", "stealth", "diplomacy"],
-                "starting_items": ["sword", "shield", "light armor"]
-            },
-            "Mage": {
-                "strengths": ["magic", "knowledge", "perception"],
-                "weaknesses": ["physical combat", "endurance", "heavy armor"],
-                "starting_items": ["staff", "spellbook", "potion"]
-            },
-            "Rogue": {
-                "strengths": ["stealth", "agility", "traps"],
-                "weaknesses": ["direct combat", "magic resistance", "heavy armor"],
-                "starting_items": ["dagger", "lockpicks", "light armor"]
-            }
-        }
+        self.character_traits = CHARACTER_TRAITS
         
         # Game world locations and their descriptions
-        self.locations = {
-            "starting_point": "The crossroads where your journey begins.",
-            "village": "A small, peaceful village with friendly inhabitants.",
-            "dark_forest": "An ancient forest where light barely penetrates the canopy.",
-            "mountain_pass": "A treacherous path through the mountains.",
-            "ancient_ruins": "The crumbling remains of a once-great civilization.",
-            "wizard_tower": "A tall tower where a powerful wizard resides.",
-            "bandit_camp": "A hidden encampment used by local bandits.",
-            "dragon_lair": "A cave system where a fearsome dragon has made its home.",
-            "underground_city": "A vast city built beneath the surface, home to dwarves and other subterranean races.",
-            "elven_forest": "A magical forest protected by ancient elven magic."
-        }
+        self.locations = LOCATIONS
         
         # Potential encounters for each location
         self.encounters = {
@@ -74,20 +48,8 @@ class AdventureGame:
         """
         Generate a personalized introduction for the player based on their name and class.
         """
-        strengths = ", ".join(self.character_traits[character_class]["strengths"])
-        weaknesses = ", ".join(self.character_traits[character_class]["weaknesses"])
-        items = ", ".join(self.character_traits[character_class]["starting_items"])
-        
-        prompt = f"""
-        Create an engaging introduction for a text-based adventure game. The player's name is {player_name} and they are a {character_class}.
-        
-        As a {character_class}, they are skilled in {strengths}, but may struggle with {weaknesses}.
-        They begin their journey with the following items: {items}.
-        
-        The introduction should welcome the player to the world, provide some background on their character,
-        and hint at an upcoming adventure or threat they will face.
-        Keep it concise but immersive.
-        """
+        strengths, weaknesses, items = describe_character(character_class)
+        prompt = build_introduction_prompt(player_name, character_class)
         
         # Get introduction from LLM
         introduction = llm.generate_text(prompt, max_length=400)
@@ -127,40 +89,18 @@ class AdventureGame:
         """
         Process the player's chosen action and generate the next part of the story.
         """
-        player_name = game_state.player_name
-        character_class = game_state.character_class
-        current_location = game_state.location
-        inventory = game_state.inventory
-        health = game_state.health
-        history = game_state.history
-        
-        # Add the chosen action to the history
-        history_text = ", ".join(history[-3:] if len(history) > 3 else history)
-        game_state.history.append(action)
-        
         # Determine if this is a combat encounter (30% chance)
         is_combat = random.random() < 0.3
         
         # Generate a prompt for the LLM based on the current state and action
-        prompt = f"""
-        In a fantasy text adventure game:
-        - Player: {player_name}, a {character_class} with {health} health points
-        - Current location: {self.locations.get(current_location, current_location)}
-        - Inventory: {', '.join(inventory) if inventory else 'empty'}
-        - Recent history: {history_text}
-        
-        The player has chosen to: {action}
-        
-        {"This leads to a combat encounter. " if is_combat else ""}
+        prompt = build_action_prompt(
+            game_state.player_name, game_state.character_class, game_state.health,
+            game_state.location, game_state.inventory, game_state.history,
+            action, is_combat
+        )
         
-        Generate a short, engaging continuation of the story (3-4 sentences) that:
-        1. Describes what happens when the player chooses this action
-        2. Includes sensory details and atmosphere
-        3. {"Describes a combat situation and how much health the player loses (between 5-20 points)" if is_combat else "Describes what the player discovers or experiences"}
-        4. Ends with a situation that leads to new choices
-        
-        Response:
-        """
+        # Add the chosen action to the history
+        game_state.history.append(action)
         
         # Get story continuation from LLM
         story_continuation = llm.generate_text(prompt, max_length=350)
@@ -0,0 +1,88 @@
+# Prompt templates and the game data they draw on.
+# Kept free of LLM setup so they can be imported without loading a model.
+
+CHARACTER_TRAITS = {
+    "Warrior": {
+        "strengths": ["combat", "strength", "endurance"],
+        "weaknesses": ["magic", "stealth", "diplomacy"],
+        "starting_items": ["sword", "shield", "light armor"]
+    },
+    "Mage": {
+        "strengths": ["magic", "knowledge", "perception"],
+        "weaknesses": ["physical combat", "endurance", "heavy armor"],
+        "starting_items": ["staff", "spellbook", "potion"]
+    },
+    "Rogue": {
+        "strengths": ["stealth", "agility", "traps"],
+        "weaknesses": ["direct combat", "magic resistance", "heavy armor"],
+        "starting_items": ["dagger", "lockpicks", "light armor"]
+    }
+}
+
+LOCATIONS = {
+    "starting_point": "The crossroads where your journey begins.",
+    "village": "A small, peaceful village with friendly inhabitants.",
+    "dark_forest": "An ancient forest where light barely penetrates the canopy.",
+    "mountain_pass": "A treacherous path through the mountains.",
+    "ancient_ruins": "The crumbling remains of a once-great civilization.",
+    "wizard_tower": "A tall tower where a powerful wizard resides.",
+    "bandit_camp": "A hidden encampment used by local bandits.",
+    "dragon_lair": "A cave system where a fearsome dragon has made its home.",
+    "underground_city": "A vast city built beneath the surface, home to dwarves and other subterranean races.",
+    "elven_forest": "A magical forest protected by ancient elven magic."
+}
+
+def describe_character(character_class):
+    """
+    Return the class's strengths, weaknesses and starting items as comma-separated strings.
+    """
+    traits = CHARACTER_TRAITS[character_class]
+    strengths = ", ".join(traits["strengths"])
+    weaknesses = ", ".join(traits["weaknesses"])
+    items = ", ".join(traits["starting_items"])
+    return strengths, weaknesses, items
+
+def build_introduction_prompt(player_name, character_class):
+    """
+    Build the LLM prompt used to introduce a new player.
+    """
+    strengths, weaknesses, items = describe_character(character_class)
+    
+    prompt = f"""
+        Create an engaging introduction for a text-based adventure game. The player's name is {player_name} and they are a {character_class}.
+        
+        As a {character_class}, they are skilled in {strengths}, but may struggle with {weaknesses}.
+        They begin their journey with the following items: {items}.
+        
+        The introduction should welcome the player to the world, provide some background on their character,
+        and hint at an upcoming adventure or threat they will face.
+        Keep it concise but immersive.
+        """
+    return prompt
+
+def build_action_prompt(player_name, character_class, health, current_location, inventory, history, action, is_combat):
+    """
+    Build the LLM prompt for the player's action, using the history before this action.
+    """
+    history_text = ", ".join(history[-3:] if len(history) > 3 else history)
+    
+    prompt = f"""
+        In a fantasy text adventure game:
+        - Player: {player_name}, a {character_class} with {health} health points
+        - Current location: {LOCATIONS.get(current_location, current_location)}
+        - Inventory: {', '.join(inventory) if inventory else 'empty'}
+        - Recent history: {history_text}
+        
+        The player has chosen to: {action}
+        
+        {"This leads to a combat encounter. " if is_combat else ""}
+        
+        Generate a short, engaging continuation of the story (3-4 sentences) that:
+        1. Describes what happens when the player chooses this action
+        2. Includes sensory details and atmosphere
+        3. {"Describes a combat situation and how much health the player loses (between 5-20 points)" if is_combat else "Describes what the player discovers or experiences"}
+        4. Ends with a situation that leads to new choices
+        
+        Response:
+        """
+    return prompt
@@ -3,10 +3,11 @@ import requests
 import json
 import time
 import random
-from transformers import pipeline
+import threading
+from transformers import pipeline, AutoModelForCausalLM, AutoTokenizer
 
 # Choose which LLM implementation to use
-# Options: 'local', 'huggingface', 'ollama'
+# Options: 'local', 'assisted', 'huggingface', 'ollama'
 LLM_IMPLEMENTATION = 'local'  # Change this based on your preference
 
 class LLMInterface:
@@ -26,6 +27,115 @@ class LocalLLM(LLMInterface):
         result = self.generator(prompt, max_length=max_length, num_return_sequences=1)
         return result[0]['generated_text'][len(prompt):]
 
+class AssistedLLM(LLMInterface):
+    """Uses a larger local model with a small draft model for assisted decoding.
+
+    The draft model proposes a few tokens at a time and the target model
+    verifies them in a single forward pass, so most tokens cost one cheap
+    draft step instead of one expensive target step. Both models must share
+    a tokenizer (e.g. the gpt2 family).
+    """
+    
+    def __init__(self, model_name="gpt2-large", draft_model_name="gpt2", verbose=True):
+        self.verbose = verbose
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModelForCausalLM.from_pretrained(model_name)
+        self.draft_model = AutoModelForCausalLM.from_pretrained(draft_model_name)
+        if self.model.config.vocab_size != self.draft_model.config.vocab_size:
+            raise ValueError(
+                f"Draft model {draft_model_name} (vocab size {self.draft_model.config.vocab_size}) "
+                f"does not share a tokenizer with {model_name} (vocab size {self.model.config.vocab_size})"
+            )
+        self.model.eval()
+        self.draft_model.eval()
+        
+        # Count forward passes so we can report how many drafted tokens were accepted.
+        # The hooks share these counters, so generate_text holds the lock while using them.
+        self._lock = threading.Lock()
+        self._target_calls = 0
+        self._draft_calls = 0
+        self.model.register_forward_hook(self._count_target_call)
+        self.draft_model.register_forward_hook(self._count_draft_call)
+        
+        self.stats = {
+            "generations": 0,
+            "new_tokens": 0,
+            "draft_tokens": 0,
+            "accepted_tokens": 0,
+            "target_passes": 0,
+            "seconds": 0.0,
+        }
+        self.last_stats = {}
+    
+    def _count_target_call(self, module, inputs, output):
+        self._target_calls += 1
+    
+    def _count_draft_call(self, module, inputs, output):
+        self._draft_calls += 1
+    
+    def generate_text(self, prompt, max_length=300, do_sample=True):
+        # Imported here so the other backends keep working without torch installed
+        import torch
+        
+        inputs = self.tokenizer(prompt, return_tensors="pt")
+        prompt_tokens = inputs["input_ids"].shape[1]
+        
+        with self._lock:
+            self._target_calls = 0
+            self._draft_calls = 0
+            
+            start = time.perf_counter()
+            with torch.no_grad():
+                output = self.model.generate(
+                    **inputs,
+                    assistant_model=self.draft_model,
+                    max_length=max_length,
+                    do_sample=do_sample,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                )
+            elapsed = time.perf_counter() - start
+            
+            new_tokens = output.shape[1] - prompt_tokens
+            # Assumes transformers' assisted decoding (as pinned, 4.49) runs exactly one
+            # target forward pass per iteration, emitting the accepted draft tokens plus
+            # one token of its own. Re-check this if transformers is upgraded.
+            accepted = max(new_tokens - self._target_calls, 0)
+            self.last_stats = {
+                "new_tokens": new_tokens,
+                "draft_tokens": self._draft_calls,
+                "accepted_tokens": accepted,
+                "target_passes": self._target_calls,
+                "seconds": elapsed,
+                "acceptance_rate": accepted / self._draft_calls if self._draft_calls else 0.0,
+                "tokens_per_second": new_tokens / elapsed if elapsed else 0.0,
+            }
+            self.stats["generations"] += 1
+            for key in ("new_tokens", "draft_tokens", "accepted_tokens", "target_passes", "seconds"):
+                self.stats[key] += self.last_stats[key]
+            stats = self.last_stats
+        
+        if self.verbose:
+            print(f"Assisted decoding: {stats['new_tokens']} tokens in {stats['seconds']:.2f}s "
+                  f"({stats['tokens_per_second']:.1f} tok/s), "
+                  f"acceptance rate {stats['acceptance_rate']:.0%}")
+        
+        # Decode only the new tokens so the prompt never has to round-trip through the tokenizer
+        return self.tokenizer.decode(output[0, prompt_tokens:], skip_special_tokens=True)
+    
+    def acceptance_rate(self):
+        """Fraction of drafted tokens accepted by the target model so far"""
+        with self._lock:
+            if not self.stats["draft_tokens"]:
+                return 0.0
+            return self.stats["accepted_tokens"] / self.stats["draft_tokens"]
+    
+    def tokens_per_second(self):
+        """Average decode throughput across all generations so far"""
+        with self._lock:
+            if not self.stats["seconds"]:
+                return 0.0
+            return self.stats["new_tokens"] / self.stats["seconds"]
+
 class HuggingFaceLLM(LLMInterface):
     """Uses Hugging Face Inference API"""
     
@@ -195,6 +305,19 @@ def get_llm():
             print("Falling back to rule-based generation")
             return FallbackLLM()
     
+    elif LLM_IMPLEMENTATION == 'assisted':
+        try:
+            return AssistedLLM()
+        except Exception as e:
+            print(f"Failed to initialize assisted LLM: {e}")
+            print("Falling back to local LLM")
+        try:
+            return LocalLLM()
+        except Exception as e:
+            print(f"Failed to initialize local LLM: {e}")
+            print("Falling back to rule-based generation")
+            return FallbackLLM()
+    
     elif LLM_IMPLEMENTATION == 'huggingface':
         api_key = os.environ.get("HUGGINGFACE_API_KEY")
         if not api_key: